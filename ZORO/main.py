@@ -1,29 +1,37 @@
-"""Zoro Product Scraper — ScrapingBee + Playwright + Requests Hybrid
+"""Zoro Product Scraper — aiohttp direct → ScrapingBee → Playwright Hybrid
 
 Now includes:
-✅ ScrapingBee for Cloudflare-safe scraping
+✅ Direct HTTP first for statically served results
+✅ ScrapingBee for Cloudflare-safe scraping when that misses
+   (set SCRAPINGBEE_API_KEY; --mode basic skips both fallbacks)
 ✅ Playwright fallback if ScrapingBee fails
-✅ Requests backup for static content
 ✅ Smarter fuzzy matching, normalization, and /i/ link fallbacks
+✅ Concurrent asyncio pipeline over a pooled Playwright browser
 """
 
 from __future__ import annotations
-import random, re, time
+import argparse, asyncio, gzip, hashlib, os, re, time, zlib
+from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass
-from pathlib import Path
-from typing import Iterable, List, Optional
-
+from functools import partial
+from operator import attrgetter
+from pathlib import Path, PurePosixPath
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import quote, urljoin, urlsplit
+
+import aiohttp
+import numpy as np
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
-from rapidfuzz import fuzz
+import xlsxwriter
+from lxml import etree, html as lxhtml
+from rapidfuzz import fuzz, process
 
 # ---------------------------------------------------------------------------
 # ScrapingBee configuration
 # ---------------------------------------------------------------------------
-SCRAPINGBEE_API_KEY = "64MS0CGV3U2L4FZF3SHCEYKE56LS6APVEOD9PQ6SW307XYMY11GNWC0NPMS6S0XFZFMQZ9G8PD7NFBCL"
+# Read from the environment; without a key the hybrid mode skips ScrapingBee.
+SCRAPINGBEE_API_KEY = os.environ.get("SCRAPINGBEE_API_KEY", "")
 SCRAPINGBEE_ENDPOINT = "https://app.scrapingbee.com/api/v1/"
-USE_SCRAPINGBEE = True
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -31,9 +39,28 @@ USE_SCRAPINGBEE = True
 BASE_URL = "https://www.zoro.com"
 SEARCH_URL_TEMPLATE = BASE_URL + "/search?q={query}"
 IMAGE_DIR_NAME = "zoro_images"
+PLAYWRIGHT_PROFILE_DIR_NAME = "playwright_profile"
+HTML_CACHE_DIR_NAME = ".html_cache"
+HTML_CACHE_MAX_AGE = 3600
+# "basic" only tries a plain GET; "hybrid" escalates to ScrapingBee and Playwright.
+MODES = ("basic", "hybrid")
+DEFAULT_MODE = "hybrid"
+CONCURRENCY = 5
+SCRAPINGBEE_CONCURRENCY = 16
+IMAGE_CONCURRENCY = 16
+SEARCH_RATE_PER_MINUTE = 18
+SEARCH_BURST = 2
 MAX_RESULTS_PER_ITEM = 5
 FUZZY_MATCH_THRESHOLD = 35
+COMBINED_FUZZY_SCORE = False
 REQUEST_TIMEOUT = 25
+# Backpressure (rate limited / overloaded) is retried with exponential backoff,
+# or after the server's Retry-After when it sends one.
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+MAX_RETRIES = 5
+RETRY_BACKOFF = 1.0
+MAX_RETRY_DELAY = 60.0
+PLAYWRIGHT_CARD_WAIT_MS = 10_000
 DEBUG_MODE = False
 
 DEFAULT_HEADERS = {
@@ -47,7 +74,7 @@ DEFAULT_HEADERS = {
 # ---------------------------------------------------------------------------
 # Dataclass for results
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class ProductResult:
     search_term: str
     title: str
@@ -62,26 +89,99 @@ class ProductResult:
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
-def slugify(value: str) -> str:
-    value = value.strip().lower()
-    value = re.sub(r"[^a-z0-9]+", "_", value)
-    value = re.sub(r"_+", "_", value).strip("_")
-    return value or "item"
+# Byte table keeping a-z/0-9 and turning every other byte into a space.
+_ALNUM_BYTES = frozenset(b"abcdefghijklmnopqrstuvwxyz0123456789")
+_TO_SPACE = bytes(c if c in _ALNUM_BYTES else 0x20 for c in range(256))
 
 def normalize_text(s: str) -> str:
-    s = s.lower()
-    s = re.sub(r"[^a-z0-9]+", " ", s)
-    return s.strip()
+    # Non-ASCII characters encode as "?" and so become separators, like the
+    # [^a-z0-9]+ pattern this replaces; split() collapses runs and trims.
+    return b" ".join(s.lower().encode("ascii", "replace").translate(_TO_SPACE).split()).decode("ascii")
 
-def best_score(query: str, candidate: str) -> int:
-    if not query or not candidate:
-        return 0
-    q, c = normalize_text(query), normalize_text(candidate)
-    return max(
-        fuzz.token_set_ratio(q, c),
-        fuzz.token_sort_ratio(q, c),
-        fuzz.partial_ratio(q, c),
-    )
+def slugify(value: str) -> str:
+    # Same separator runs as normalize_text, just joined with "_".
+    return normalize_text(value).replace(" ", "_") or "item"
+
+# token_set_ratio alone ranks titles well; the max over the other two scorers
+# triples the matching cost and is kept only as an opt-in.
+FUZZY_SCORERS = (
+    (fuzz.token_set_ratio, fuzz.token_sort_ratio, fuzz.partial_ratio)
+    if COMBINED_FUZZY_SCORE
+    else (fuzz.token_set_ratio,)
+)
+
+# Words too common in product titles to show two strings are about the same thing.
+_BLOCKING_STOPWORDS = frozenset({"and", "for", "the", "with", "pack", "each", "set"})
+
+def _blocking_tokens(normalized: str) -> Set[str]:
+    """Tokens of a normalized string long and specific enough to block on."""
+    return {token for token in normalized.split() if len(token) >= 3 and token not in _BLOCKING_STOPWORDS}
+
+def _token_block(query_tokens: Set[str], normalized_candidate: str) -> bool:
+    """True when the candidate shares at least one blocking token with the query."""
+    return not query_tokens.isdisjoint(normalized_candidate.split())
+
+def rank_matches(query: str, candidates: List[str]) -> List[Tuple[int, float]]:
+    """Return (index, score) for the best MAX_RESULTS_PER_ITEM candidates at or above the threshold.
+
+    Results are ordered best first; equal scores keep candidate order.
+    Candidates sharing no blocking token with the query are never scored.
+    """
+    if not query or not candidates:
+        return []
+    # Normalize once up front rather than once per scorer inside RapidFuzz.
+    normalized_query = normalize_text(query)
+    normalized_candidates = [normalize_text(candidate) for candidate in candidates]
+    # Block on shared words; a query with none to block on (e.g. "3M", all
+    # tokens under 3 characters) lets every candidate through. Tokens must
+    # match exactly, so singular/plural variants ("locks" vs "Lock") and
+    # split spellings ("2x4" vs "2 x 4") don't count as shared.
+    query_tokens = _blocking_tokens(normalized_query)
+    kept = [
+        index for index, candidate in enumerate(normalized_candidates)
+        if not query_tokens or _token_block(query_tokens, candidate)
+    ]
+    if not kept:
+        return []
+    normalized_candidates = [normalized_candidates[index] for index in kept]
+
+    if len(FUZZY_SCORERS) == 1:
+        hits = process.extract(
+            normalized_query, normalized_candidates, scorer=FUZZY_SCORERS[0], processor=None,
+            limit=MAX_RESULTS_PER_ITEM, score_cutoff=FUZZY_MATCH_THRESHOLD,
+        )
+        return [(kept[index], score) for _, score, index in hits]
+
+    scores = np.maximum.reduce([
+        process.cdist(
+            [normalized_query], normalized_candidates, scorer=scorer, processor=None,
+            score_cutoff=FUZZY_MATCH_THRESHOLD, dtype=np.float64,
+        )[0]
+        for scorer in FUZZY_SCORERS
+    ])
+    ranked = np.argsort(-scores, kind="stable")[:MAX_RESULTS_PER_ITEM]
+    return [(kept[index], float(scores[index])) for index in ranked if scores[index] >= FUZZY_MATCH_THRESHOLD]
+
+class TokenBucket:
+    """Async token bucket: bursts of up to `burst` calls, refilled at `rate` per second."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self.tokens = 1.0
+                self.updated = time.monotonic()
+            self.tokens -= 1
 
 # ---------------------------------------------------------------------------
 # Excel ingestion
@@ -89,24 +189,49 @@ def best_score(query: str, candidate: str) -> int:
 def read_excel_items(excel_path: Path) -> List[str]:
     if not excel_path.exists():
         raise FileNotFoundError(f"Input Excel file not found: {excel_path}")
-    df = pd.read_excel(excel_path)
+    # Only load the one column we need; calamine (Rust) is much faster than openpyxl.
+    # dtype=str skips type inference, so numeric part numbers keep their digits
+    # instead of picking up a float ".0".
+    usecols = lambda column: column == "Item Name"
+    try:
+        df = pd.read_excel(excel_path, usecols=usecols, dtype=str, engine="calamine")
+    except (ImportError, ValueError):
+        df = pd.read_excel(excel_path, usecols=usecols, dtype=str)
     if "Item Name" not in df.columns:
         raise KeyError("The Excel file must contain a column named 'Item Name'.")
-    items, seen = [], set()
-    for raw_value in df["Item Name"].astype(str).fillna(""):
-        value = raw_value.strip()
-        if not value or value.lower() == "nan":
-            continue
-        norm = value.lower()
-        if norm not in seen:
-            seen.add(norm)
-            items.append(value)
-    return items
+    values = df["Item Name"].dropna().str.strip()
+    keys = values.str.lower()
+    mask = (values != "") & (keys != "nan")
+    values, keys = values[mask], keys[mask]
+    return values[~keys.duplicated()].tolist()
 
 # ---------------------------------------------------------------------------
 # Networking helpers
 # ---------------------------------------------------------------------------
-def fetch_html_with_scrapingbee(url: str) -> Optional[str]:
+def _retry_delay(response: aiohttp.ClientResponse, attempt: int) -> float:
+    retry_after = response.headers.get("Retry-After", "")
+    try:
+        delay = float(retry_after)
+    except ValueError:
+        delay = RETRY_BACKOFF * 2 ** attempt
+    return min(max(delay, 0.0), MAX_RETRY_DELAY)
+
+@asynccontextmanager
+async def get_with_retry(http: aiohttp.ClientSession, url: str, **kwargs) -> AsyncIterator[aiohttp.ClientResponse]:
+    """``http.get`` that waits and retries while the server answers with a RETRY_STATUSES code."""
+    for attempt in range(MAX_RETRIES + 1):
+        response = await http.get(url, **kwargs)
+        if response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+            break
+        delay = _retry_delay(response, attempt)
+        response.release()
+        await asyncio.sleep(delay)
+    try:
+        yield response
+    finally:
+        response.release()
+
+async def fetch_html_with_scrapingbee(url: str, http: aiohttp.ClientSession) -> Optional[str]:
     try:
         params = {
             "api_key": SCRAPINGBEE_API_KEY,
@@ -116,84 +241,268 @@ def fetch_html_with_scrapingbee(url: str) -> Optional[str]:
             "block_ads": "true",
         }
         print(f"  * ScrapingBee fetching: {url}")
-        response = requests.get(SCRAPINGBEE_ENDPOINT, params=params, timeout=REQUEST_TIMEOUT)
-        if response.status_code == 200:
-            return response.text
-        print(f"  ! ScrapingBee error {response.status_code}: {response.text[:120]}")
-        return None
+        async with get_with_retry(http, SCRAPINGBEE_ENDPOINT, params=params) as response:
+            body = await response.text(errors="replace")
+            if response.status == 200:
+                return body
+            print(f"  ! ScrapingBee error {response.status}: {body[:120]}")
+            return None
     except Exception as exc:
         print(f"  ! ScrapingBee request failed: {exc}")
         return None
 
-def fetch_html_with_playwright(url: str) -> Optional[str]:
-    try:
-        from playwright.sync_api import sync_playwright
-    except ImportError:
-        print("  ! Playwright not installed. Skipping.")
-        return None
+class PlaywrightPool:
+    """One persistent Chromium context, launched on first use, with a fixed pool of pages.
 
-    try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True, args=["--no-sandbox"])
-            context = browser.new_context()
-            page = context.new_page()
-            page.set_default_timeout(REQUEST_TIMEOUT * 1000)
-            page.goto(url, wait_until="domcontentloaded")
-            time.sleep(random.uniform(6, 10))
-            html = page.content()
-            browser.close()
+    Runs where ScrapingBee answers every search never start a browser at all.
+    """
+
+    def __init__(self, size: int, profile_dir: Path) -> None:
+        self.size = size
+        self.profile_dir = profile_dir
+        self._lock = asyncio.Lock()
+        self._started = False
+        self._playwright = None
+        self._context = None
+        self._pages: Optional[asyncio.Queue] = None
+
+    async def __aenter__(self) -> "PlaywrightPool":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._context is not None:
+            await self._context.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+
+    async def _start(self) -> None:
+        try:
+            from playwright.async_api import async_playwright
+        except ImportError:
+            print("  ! Playwright not installed. Skipping.")
+            return
+        try:
+            self._playwright = await async_playwright().start()
+            self._context = await self._playwright.chromium.launch_persistent_context(
+                str(self.profile_dir), headless=True, args=["--no-sandbox"]
+            )
+            pages: asyncio.Queue = asyncio.Queue()
+            for _ in range(self.size):
+                page = await self._context.new_page()
+                page.set_default_timeout(REQUEST_TIMEOUT * 1000)
+                pages.put_nowait(page)
+            self._pages = pages
+        except Exception as exc:
+            print(f"  ! Playwright launch failed: {exc}")
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator:
+        """Check out a page for the duration of the block, or yield None if unavailable."""
+        async with self._lock:
+            if not self._started:
+                self._started = True
+                await self._start()
+        if self._pages is None:
+            yield None
+            return
+        page = await self._pages.get()
+        try:
+            yield page
+        finally:
+            self._pages.put_nowait(page)
+
+# Tokens only present on Cloudflare's interstitial challenge page.
+_CF_CHALLENGE_RE = re.compile(r"__cf_chl_jschl_tk__|__cf_chl_opt", re.IGNORECASE)
+
+# Outer HTML of every outermost node matching the selector (nested matches are
+# already contained in their ancestor's markup).
+_CARD_FRAGMENTS_JS = """
+(selector) => {
+    const nodes = [...document.querySelectorAll(selector)];
+    return nodes
+        .filter(node => !nodes.some(other => other !== node && other.contains(node)))
+        .map(node => node.outerHTML);
+}
+"""
+
+async def fetch_html_with_playwright(url: str, browser: PlaywrightPool) -> Optional[str]:
+    async with browser.page() as page:
+        if page is None:
+            return None
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        try:
+            await page.goto(url, wait_until="domcontentloaded")
+            # Wait for cards to render instead of sleeping blindly.
+            try:
+                await page.wait_for_selector(PRODUCT_CARD_SELECTOR, timeout=PLAYWRIGHT_CARD_WAIT_MS)
+            except PlaywrightTimeoutError:
+                pass
+            else:
+                # Ship back only the card subtrees rather than serializing the whole DOM.
+                fragments = await page.evaluate(_CARD_FRAGMENTS_JS, PRODUCT_CARD_SELECTOR)
+                if fragments:
+                    return "\n".join(fragments)
+            # No cards rendered: return the full page so the challenge check and
+            # the generic /i/ anchor fallback in the parser still apply.
+            html = await page.content()
+            if _CF_CHALLENGE_RE.search(html):
+                print("  ! Playwright hit a Cloudflare challenge.")
+                return None
             return html
-    except Exception as exc:
-        print(f"  ! Playwright error: {exc}")
-        return None
+        except Exception as exc:
+            print(f"  ! Playwright error: {exc}")
+            return None
 
-def fetch_html_with_requests(url: str, session: requests.Session) -> Optional[str]:
+async def fetch_html_direct(url: str, http: aiohttp.ClientSession) -> Optional[str]:
     try:
-        response = session.get(url, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        return response.text
-    except requests.RequestException:
+        async with http.get(url) as response:
+            response.raise_for_status()
+            return await response.text(errors="replace")
+    except (aiohttp.ClientError, asyncio.TimeoutError):
         return None
 
+class HtmlCache:
+    """Gzipped search pages on disk, keyed by a hash of the URL and expired by mtime."""
+
+    def __init__(self, directory: Path, max_age: float = HTML_CACHE_MAX_AGE) -> None:
+        self.directory = directory
+        self.max_age = max_age
+
+    def path(self, url: str) -> Path:
+        return self.directory / f"{hashlib.sha1(url.encode()).hexdigest()}.html.gz"
+
+    def read(self, url: str) -> Optional[str]:
+        path = self.path(url)
+        try:
+            if time.time() - path.stat().st_mtime > self.max_age:
+                return None
+            return gzip.decompress(path.read_bytes()).decode("utf-8")
+        except (OSError, EOFError, zlib.error):
+            return None
+
+    def write(self, url: str, html: str) -> None:
+        try:
+            # Level 6 keeps most of the size win at a fraction of level 9's cost.
+            self.path(url).write_bytes(gzip.compress(html.encode("utf-8"), compresslevel=6))
+        except OSError as exc:
+            print(f"  ! Could not cache HTML: {exc}")
+
 # ---------------------------------------------------------------------------
 # Parsing helpers
 # ---------------------------------------------------------------------------
-def parse_product_data(html: str, max_results: int = MAX_RESULTS_PER_ITEM) -> List[dict]:
-    soup = BeautifulSoup(html, "html.parser")
-    cards = soup.select("a[data-test='productCard']")
-    if cards:
-        print(f"  * Found {len(cards)} product cards via [data-test='productCard'].")
-    if not cards:
-        fallback = soup.select("[data-test='productCardTitle']")
-        if fallback:
-            print(f"  * Found {len(fallback)} via [data-test='productCardTitle'] fallback.")
-            cards = fallback
-    if not cards:
-        cards = soup.select("a[href*='/i/']")
-        if cards:
-            print(f"  * Fallback: found {len(cards)} generic anchors.")
-    if not cards:
-        for tag in soup.find_all("a", href=True):
-            if "/i/" in tag["href"]:
-                cards.append(tag)
-        if cards:
-            print(f"  * Ultimate fallback found {len(cards)} /i/ links.")
+# Card matches are bucketed by priority instead of re-walking the tree once per
+# fallback. Playwright waits on the real card markers only: a header or nav
+# link to an /i/ page would otherwise match before the results grid renders.
+PRODUCT_CARD_SELECTOR = "a[data-test='productCard'], [data-test='productCardTitle']"
+CARD_XPATH = etree.XPath(
+    "//a[@data-test='productCard'] | //*[@data-test='productCardTitle'] | //a[contains(@href, '/i/')]"
+)
+# Priority of the a[href*='/i/'] bucket; lower ones are real product cards.
+GENERIC_ANCHOR_PRIORITY = 2
+CARD_SOURCE_MESSAGES = (
+    "  * Found {} product cards via [data-test='productCard'].",
+    "  * Found {} via [data-test='productCardTitle'] fallback.",
+    "  * Fallback: found {} generic anchors.",
+)
+
+def _first_xpath(expression: str) -> etree.XPath:
+    return etree.XPath(f"({expression})[1]")
+
+# Per-card lookups, in order of preference.
+TITLE_XPATHS = (
+    _first_xpath(".//*[@data-test='productCardTitle']"),
+    _first_xpath(".//*[self::h2 or self::h3 or self::span or self::div]"),
+)
+PRICE_XPATHS = (
+    _first_xpath(".//*[@data-test='productCardPrice']"),
+    _first_xpath(".//*[@data-test='price']"),
+)
+BRAND_XPATHS = (
+    _first_xpath(".//*[@data-test='product-brand']"),
+    _first_xpath(".//*[@data-test='brand-name']"),
+)
+IMAGE_XPATHS = (_first_xpath(".//img"),)
+TEXT_XPATH = etree.XPath(".//text()", smart_strings=False)
+
+def _card_priority(node) -> int:
+    data_test = node.get("data-test")
+    if node.tag == "a" and data_test == "productCard":
+        return 0
+    if data_test == "productCardTitle":
+        return 1
+    return GENERIC_ANCHOR_PRIORITY
+
+def _first(node, xpaths: tuple):
+    for xpath in xpaths:
+        found = xpath(node)
+        if found:
+            return found[0]
+    return None
+
+def _text(node, sep: str = "") -> str:
+    """Stripped descendant text joined by sep, like BeautifulSoup's get_text(sep, strip=True)."""
+    return sep.join(filter(None, (part.strip() for part in TEXT_XPATH(node))))
+
+def _absolute_url(value: str) -> str:
+    """Resolve a relative or scheme-relative ("//host/...") URL against BASE_URL."""
+    try:
+        return urljoin(BASE_URL, value) if value else ""
+    except ValueError:
+        return ""
+
+def parse_product_data(
+    html: str, max_results: int = MAX_RESULTS_PER_ITEM, query: str = ""
+) -> Tuple[Optional[int], List[dict]]:
+    """Extract up to ``max_results`` cards.
+
+    Also returns the priority of the selector the cards came from, or ``None``
+    if the page has no product cards at all.
+    """
+    # Blocked, challenge and empty pages carry neither marker; skip the DOM build.
+    if "productCard" not in html and "/i/" not in html:
+        print("  * No product cards detected after all selectors.")
+        return None, []
+    try:
+        root = lxhtml.document_fromstring(html)
+    except (etree.ParserError, ValueError):
+        return None, []
+    buckets: List[list] = [[] for _ in CARD_SOURCE_MESSAGES]
+    for node in CARD_XPATH(root):
+        buckets[_card_priority(node)].append(node)
+
+    priority: Optional[int] = None
+    cards: list = []
+    for index, (message, bucket) in enumerate(zip(CARD_SOURCE_MESSAGES, buckets)):
+        if bucket:
+            print(message.format(len(bucket)))
+            priority, cards = index, bucket
+            break
     if not cards:
         print("  * No product cards detected after all selectors.")
+        return None, []
 
+    # Cards sharing no word with the query could never be ranked; skip their
+    # field lookups and keep their slots for cards that could.
+    query_tokens = _blocking_tokens(normalize_text(query))
     results: List[dict] = []
     for card in cards:
         try:
-            title_tag = card.select_one("[data-test='productCardTitle']") or card.select_one("h2,h3,span,div")
-            title = title_tag.get_text(" ", strip=True) if title_tag else card.get_text(" ", strip=True)
+            card_text = _text(card, " ")
+            if query_tokens and not _token_block(query_tokens, normalize_text(card_text)):
+                continue
+            title_node = _first(card, TITLE_XPATHS)
+            title = _text(title_node, " ") if title_node is not None else card_text
             href = card.get("href", "")
             url = href if href.startswith("http") else f"{BASE_URL}{href}" if href else ""
-            price_tag = card.select_one("[data-test='productCardPrice']") or card.select_one("[data-test='price']")
-            price = price_tag.get_text(strip=True) if price_tag else ""
-            brand_tag = card.select_one("[data-test='product-brand']") or card.select_one("[data-test='brand-name']")
-            brand = brand_tag.get_text(strip=True) if brand_tag else ""
-            image_tag = card.select_one("img")
-            image_url = image_tag.get("src") or image_tag.get("data-src") or "" if image_tag else ""
+            price_node = _first(card, PRICE_XPATHS)
+            price = _text(price_node) if price_node is not None else ""
+            brand_node = _first(card, BRAND_XPATHS)
+            brand = _text(brand_node) if brand_node is not None else ""
+            image_node = _first(card, IMAGE_XPATHS)
+            image_url = ""
+            if image_node is not None:
+                image_url = _absolute_url(image_node.get("src") or image_node.get("data-src") or "")
             if not title and not url:
                 continue
             results.append({
@@ -207,109 +516,300 @@ def parse_product_data(html: str, max_results: int = MAX_RESULTS_PER_ITEM) -> Li
             continue
         if len(results) >= max_results:
             break
-    return results
+    return priority, results
 
 # ---------------------------------------------------------------------------
 # Core search logic with triple fallback
 # ---------------------------------------------------------------------------
-def search_zoro(item_name: str, session: requests.Session) -> List[ProductResult]:
-    query_url = SEARCH_URL_TEMPLATE.format(query=requests.utils.quote(item_name))
-    html = None
-
-    # 1️⃣ Try ScrapingBee first
-    if USE_SCRAPINGBEE:
-        html = fetch_html_with_scrapingbee(query_url)
-
-    # 2️⃣ Fallback to Playwright
-    if not html:
-        print("  ! ScrapingBee failed — trying Playwright...")
-        html = fetch_html_with_playwright(query_url)
-
-    # 3️⃣ Final fallback to requests
-    if not html:
-        print("  ! Playwright failed — trying plain requests.")
-        html = fetch_html_with_requests(query_url, session)
-
-    if not html:
-        print(f"  ❌ Failed to retrieve results for '{item_name}'.")
-        return []
-
-    raw_results = parse_product_data(html, max_results=MAX_RESULTS_PER_ITEM * 2)
-    if not raw_results:
-        print("  ! No product cards detected on the page.")
-        return []
-
+def parse_and_score(item_name: str, html: str) -> Tuple[Optional[int], List[ProductResult]]:
+    """Parse a search page and rank its cards against ``item_name``.
+
+    Pure, so it can run off the event loop in a worker thread. Also returns the
+    card selector priority from parse_product_data, so the caller can tell a
+    real results grid from a page that only links to a few products.
+    """
+    priority, raw_results = parse_product_data(html, max_results=MAX_RESULTS_PER_ITEM * 2, query=item_name)
+    if priority is None:
+        return None, []
+
+    titles = [raw.get("title", "") for raw in raw_results]
     results: List[ProductResult] = []
-    for raw in raw_results:
-        title = raw.get("title", "")
-        url = raw.get("url", "")
-        price = raw.get("price", "")
-        brand = raw.get("brand", "")
-        image_url = raw.get("image_url", "")
-        match_score = best_score(item_name, title)
-        if match_score < FUZZY_MATCH_THRESHOLD:
-            continue
+    for index, match_score in rank_matches(item_name, titles):
+        raw = raw_results[index]
         results.append(ProductResult(
             search_term=item_name,
-            title=title,
-            url=url,
-            price=price,
+            title=raw.get("title", ""),
+            url=raw.get("url", ""),
+            price=raw.get("price", ""),
             sku="",
-            brand=brand,
-            image_url=image_url,
+            brand=raw.get("brand", ""),
+            image_url=raw.get("image_url", ""),
             image_path="",
             match_score=match_score,
         ))
-        if len(results) >= MAX_RESULTS_PER_ITEM:
-            break
 
     if not results:
         print("  ! No close matches met the fuzzy match threshold.")
-    return results
+    return priority, results
+
+def _is_final_page(priority: Optional[int], results: List[ProductResult], rendered: bool) -> bool:
+    # Matches, or a rendered card grid that simply has none. An unrendered
+    # page may hold only part of the grid, and a page with only generic /i/
+    # links (a JS shell, a partial block, a nav bar) is a miss either way.
+    return bool(results) or (rendered and priority is not None and priority < GENERIC_ANCHOR_PRIORITY)
+
+# (name, fetch(url) coroutine function, draws from the zoro.com rate limit,
+#  runs the page's JavaScript)
+Fetcher = Tuple[str, Callable[[str], Awaitable[Optional[str]]], bool, bool]
+
+def build_fetchers(mode: str, http: aiohttp.ClientSession, browser: PlaywrightPool) -> Tuple[Fetcher, ...]:
+    """Fetch ladder for ``mode``, cheapest first.
+
+    A plain GET, then ScrapingBee's paid render, then our own browser. Rungs
+    that hit zoro.com from our own IP draw from the rate limit; ScrapingBee
+    goes out through its proxies and is bounded separately.
+    """
+    direct: Fetcher = ("direct request", partial(fetch_html_direct, http=http), True, False)
+    if mode == "basic":
+        return (direct,)
+    fetchers = [direct]
+    if SCRAPINGBEE_API_KEY:
+        fetchers.append(("ScrapingBee", partial(fetch_html_with_scrapingbee, http=http), False, True))
+    fetchers.append(("Playwright", partial(fetch_html_with_playwright, browser=browser), True, True))
+    return tuple(fetchers)
+
+async def search_zoro(
+    item_name: str,
+    fetchers: Iterable[Fetcher],
+    bucket: TokenBucket,
+    cache: Optional[HtmlCache],
+) -> List[ProductResult]:
+    query_url = SEARCH_URL_TEMPLATE.format(query=quote(item_name))
+
+    # Only pages that produced matches are cached.
+    html = cache.read(query_url) if cache else None
+    if html:
+        _, results = await asyncio.to_thread(parse_and_score, item_name, html)
+        if results:
+            print("  * Using cached search page.")
+            return results
+
+    fetched_any = saw_cards = False
+    # Escalate until a rung yields matches or a rendered grid without any.
+    for name, fetch, throttled, rendered in fetchers:
+        if throttled:
+            await bucket.acquire()
+        html = await fetch(query_url)
+        if html:
+            fetched_any = True
+            priority, results = await asyncio.to_thread(parse_and_score, item_name, html)
+            if results and cache:
+                cache.write(query_url, html)
+            if _is_final_page(priority, results, rendered):
+                return results
+            if priority is not None:
+                saw_cards = True
+                print(f"  ! No matching product cards via {name}.")
+                continue
+        print(f"  ! No product cards via {name}.")
+
+    if not fetched_any:
+        print(f"  ❌ Failed to retrieve results for '{item_name}'.")
+    elif not saw_cards:
+        print("  ! No product cards detected on the page.")
+    return []
 
 # ---------------------------------------------------------------------------
 # Image and Excel I/O
 # ---------------------------------------------------------------------------
-def download_image(image_url: str, target_dir: Path, base_name: str, session: requests.Session) -> str:
+def image_filename(image_url: str) -> str:
+    """Stable name for an image URL: a readable stem plus a short hash of the full URL."""
+    # Cap the stem so a long URL can't exceed the filesystem's name limit.
+    stem = slugify(PurePosixPath(urlsplit(image_url).path).stem)[:100]
+    key = hashlib.blake2b(image_url.encode(), digest_size=8).hexdigest()
+    return f"{stem}_{key}.jpg"
+
+async def download_image(
+    image_url: str, target_dir: Path, http: aiohttp.ClientSession, downloaded: Set[str]
+) -> str:
     if not image_url:
         return ""
-    target_dir.mkdir(parents=True, exist_ok=True)
-    file_path = target_dir / f"{base_name}.jpg"
-    if file_path.exists():
-        return str(file_path)
+    file_path: Optional[Path] = None
     try:
-        response = session.get(image_url, stream=True, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        with open(file_path, "wb") as fh:
-            for chunk in response.iter_content(chunk_size=8192):
-                fh.write(chunk)
+        file_name = image_filename(image_url)
+        file_path = target_dir / file_name
+        if file_name in downloaded:
+            return str(file_path)
+        async with get_with_retry(http, image_url) as response:
+            response.raise_for_status()
+            with open(file_path, "wb") as fh:
+                async for chunk in response.content.iter_chunked(1 << 20):
+                    fh.write(chunk)
+        downloaded.add(file_name)
         return str(file_path)
-    except requests.RequestException:
-        if file_path.exists():
-            file_path.unlink(missing_ok=True)
+    except Exception as exc:
+        # A bad URL or a failed write costs this image, never the run.
+        print(f"  ! Image download failed for {image_url}: {exc!r}")
+        if file_path is not None:
+            with suppress(OSError):
+                file_path.unlink(missing_ok=True)
         return ""
 
+OUTPUT_COLUMNS = (
+    "Search Term",
+    "Product Title",
+    "Product URL",
+    "Product Price",
+    "Brand",
+    "Image URL",
+    "Downloaded Image Path",
+    "Match Score",
+)
+_output_row = attrgetter(
+    "search_term",
+    "title",
+    "url",
+    "price",
+    "brand",
+    "image_url",
+    "image_path",
+    "match_score",
+)
+
 def save_to_excel(results: Iterable[ProductResult], output_path: Path) -> None:
-    rows = [{
-        "Search Term": r.search_term,
-        "Product Title": r.title,
-        "Product URL": r.url,
-        "Product Price": r.price,
-        "Brand": r.brand,
-        "Image URL": r.image_url,
-        "Downloaded Image Path": r.image_path,
-        "Match Score": r.match_score,
-    } for r in results]
-    pd.DataFrame(rows).to_excel(output_path, index=False)
+    # constant_memory flushes each row as soon as the next one starts, so memory
+    # stays flat however many results there are.
+    wb = xlsxwriter.Workbook(str(output_path), {"constant_memory": True, "strings_to_urls": False})
+    ws = wb.add_worksheet()
+    ws.write_row(0, 0, OUTPUT_COLUMNS)
+    for row, r in enumerate(results, start=1):
+        ws.write_row(row, 0, _output_row(r))
+    wb.close()
 
 # ---------------------------------------------------------------------------
 # Main execution
 # ---------------------------------------------------------------------------
+def not_found_result(item_name: str) -> ProductResult:
+    return ProductResult(
+        search_term=item_name,
+        title="Not found",
+        url="",
+        price="",
+        sku="",
+        brand="",
+        image_url="",
+        image_path="",
+        match_score=0,
+    )
+
+async def scrape_items(
+    items: List[str],
+    base_dir: Path,
+    use_cache: bool = True,
+    mode: str = DEFAULT_MODE,
+    max_cache_age: float = HTML_CACHE_MAX_AGE,
+) -> List[ProductResult]:
+    image_dir = base_dir / IMAGE_DIR_NAME
+    cache = HtmlCache(base_dir / HTML_CACHE_DIR_NAME, max_cache_age) if use_cache else None
+    # Create the folders and index what earlier runs saved once, up front.
+    image_dir.mkdir(parents=True, exist_ok=True)
+    if cache:
+        cache.directory.mkdir(parents=True, exist_ok=True)
+    downloaded = {path.name for path in image_dir.iterdir()}
+    # ScrapingBee calls aren't tied to the Playwright page pool, so more items
+    # can be in flight when it is the primary fetcher.
+    use_scrapingbee = mode == "hybrid" and bool(SCRAPINGBEE_API_KEY)
+    if mode == "hybrid" and not use_scrapingbee:
+        print("SCRAPINGBEE_API_KEY is not set; skipping ScrapingBee (direct request, then Playwright).")
+    workers = SCRAPINGBEE_CONCURRENCY if use_scrapingbee else CONCURRENCY
+    semaphore = asyncio.Semaphore(workers)
+    image_semaphore = asyncio.Semaphore(IMAGE_CONCURRENCY)
+    cooldown = asyncio.Lock()
+    bucket = TokenBucket(rate=SEARCH_RATE_PER_MINUTE / 60, burst=SEARCH_BURST)
+    consecutive_failures = 0
+
+    async with (
+        PlaywrightPool(CONCURRENCY, base_dir / PLAYWRIGHT_PROFILE_DIR_NAME) as browser,
+        aiohttp.ClientSession(
+            headers=DEFAULT_HEADERS,
+            connector=aiohttp.TCPConnector(limit=64, keepalive_timeout=30),
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+        ) as http,
+    ):
+        fetchers = build_fetchers(mode, http, browser)
+
+        # One download per distinct URL; products sharing a thumbnail await it.
+        image_tasks: Dict[str, asyncio.Task] = {}
+
+        async def download_bounded(image_url: str) -> str:
+            async with image_semaphore:
+                return await download_image(image_url, image_dir, http, downloaded)
+
+        async def fetch_image(product: ProductResult) -> None:
+            task = image_tasks.get(product.image_url)
+            if task is None:
+                task = image_tasks[product.image_url] = asyncio.create_task(download_bounded(product.image_url))
+            product.image_path = await task
+
+        async def search_and_download(item_name: str) -> List[ProductResult]:
+            nonlocal consecutive_failures
+            async with semaphore:
+                # Wait out any cooldown triggered by another worker.
+                async with cooldown:
+                    pass
+                print(f"\n🔎 Searching for: {item_name}...")
+                results = await search_zoro(item_name, fetchers, bucket, cache)
+
+                if not results:
+                    consecutive_failures += 1
+                    if consecutive_failures >= 3:
+                        consecutive_failures = 0
+                        print("⚠️  Encountered 3 failed searches. Pausing for 60 seconds...")
+                        async with cooldown:
+                            await asyncio.sleep(60)
+                    return [not_found_result(item_name)]
+                consecutive_failures = 0
+
+            # Images download outside the semaphore so the next search can
+            # start while this item's thumbnails are still in flight.
+            await asyncio.gather(*(fetch_image(product) for product in results))
+            for product in results:
+                print(f"  ✅ {product.title} ({product.match_score})")
+            return results
+
+        async def process_item(item_name: str) -> List[ProductResult]:
+            # One failing item becomes a "Not found" row instead of taking the
+            # whole gather, and every other item's results, down with it.
+            try:
+                return await search_and_download(item_name)
+            except Exception as exc:
+                print(f"  ❌ Error while processing '{item_name}': {exc!r}")
+                return [not_found_result(item_name)]
+
+        batches = await asyncio.gather(*(process_item(item_name) for item_name in items))
+    return [product for batch in batches for product in batch]
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Search Zoro for every item in test_items.xlsx.")
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Neither read nor write the on-disk search page cache.",
+    )
+    parser.add_argument(
+        "--max-cache-age", type=float, default=HTML_CACHE_MAX_AGE, metavar="SECONDS",
+        help=f"Refetch cached search pages older than this (default: {HTML_CACHE_MAX_AGE}).",
+    )
+    parser.add_argument(
+        "--mode", choices=MODES, default=DEFAULT_MODE,
+        help="basic: plain HTTP only. hybrid: escalate to ScrapingBee and Playwright.",
+    )
+    return parser.parse_args(argv)
+
 def main() -> None:
+    args = parse_args()
     base_dir = Path(__file__).resolve().parent
     excel_path = base_dir / "test_items.xlsx"
     output_path = base_dir / "zoro_results.xlsx"
-    image_dir = base_dir / IMAGE_DIR_NAME
 
     try:
         items = read_excel_items(excel_path)
@@ -320,45 +820,12 @@ def main() -> None:
         print("No valid items found in the Excel file.")
         return
 
-    session = requests.Session()
-    session.headers.update(DEFAULT_HEADERS)
-    all_results: List[ProductResult] = []
-    consecutive_failures = 0
-
-    for item_name in items:
-        print(f"\n🔎 Searching for: {item_name}...")
-        results = search_zoro(item_name, session)
-
-        if not results:
-            all_results.append(ProductResult(
-                search_term=item_name,
-                title="Not found",
-                url="",
-                price="",
-                sku="",
-                brand="",
-                image_url="",
-                image_path="",
-                match_score=0,
-            ))
-            consecutive_failures += 1
-        else:
-            consecutive_failures = 0
-            for idx, product in enumerate(results, start=1):
-                base_name = "_".join(filter(None, [slugify(item_name), str(idx)]))
-                product.image_path = download_image(product.image_url, image_dir, base_name, session)
-                all_results.append(product)
-                print(f"  ✅ {product.title} ({product.match_score})")
-
-                if product.image_url:
-                    time.sleep(random.uniform(2, 4))
-
-        if consecutive_failures >= 3:
-            print("⚠️  Encountered 3 failed searches. Pausing for 60 seconds...")
-            time.sleep(60)
-            consecutive_failures = 0
-
-        time.sleep(random.uniform(4, 9))
+    all_results = asyncio.run(scrape_items(
+        items, base_dir,
+        use_cache=not args.no_cache,
+        mode=args.mode,
+        max_cache_age=args.max_cache_age,
+    ))
 
     try:
         save_to_excel(all_results, output_path)